@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""
+Duration-aware sharded scheduler for the UX checks.
+
+Expands (route x check x viewport x throttle profile) into work items and runs
+them on local worker processes or on other hosts through a file-based queue.
+Items are ordered longest-first using historical durations, crashed workers
+have their items re-queued, and partial results merge into one report.
+
+The queue is a plain directory, so a shared mount is enough to fan out across
+machines; a temporary local directory is the stand-in for development:
+
+    python check_scheduler.py run --workers 4 --check check_scheduler:page_load_check
+    python check_scheduler.py enqueue --queue /mnt/ux-queue --check ...
+    python check_scheduler.py worker --queue /mnt/ux-queue      # on each host
+    python check_scheduler.py merge /mnt/ux-queue --output ux-check-report.json
+"""
+
+import argparse
+import hashlib
+import importlib
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+
+BASE_URL = os.environ.get("UX_BASE_URL", "http://localhost:3000")
+
+ROUTES = [
+    "/",
+    "/history",
+    "/history/TEST-001/collection-opportunities",
+    "/history/TEST-001/field-mapping-review",
+    "/collection/TEST-001/manage",
+    "/analytics",
+    "/sccs",
+    "/sccs/new",
+    "/decks",
+    "/create-collection-deck/data",
+]
+
+VIEWPORTS = {
+    "mobile": {"width": 375, "height": 667},
+    "tablet": {"width": 768, "height": 1024},
+    "desktop": {"width": 1280, "height": 720},
+}
+
+# Chrome DevTools network/CPU emulation settings; throughput is bytes per second.
+THROTTLE_PROFILES = {
+    "none": None,
+    "fast-3g": {"latency": 150, "download": 1.6 * 1024 * 1024 / 8, "upload": 750 * 1024 / 8, "cpu": 4},
+    "slow-3g": {"latency": 400, "download": 500 * 1024 / 8, "upload": 500 * 1024 / 8, "cpu": 6},
+}
+
+DEFAULT_DURATION = 5.0
+DEFAULT_LEASE = 120.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+# mkstemp creates files 0600; queue files must stay readable by workers running
+# as other users on a shared mount, so results follow the umask like open() would.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@dataclass
+class WorkItem:
+    route: str
+    check: str
+    viewport: str = "desktop"
+    throttle: str = "none"
+    attempts: int = 0
+
+    @property
+    def key(self):
+        """Stable identity used for duration history and result files."""
+        return f"{self.check}|{self.route}|{self.viewport}|{self.throttle}"
+
+    @property
+    def item_id(self):
+        return hashlib.sha1(self.key.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def url(self):
+        return BASE_URL.rstrip("/") + self.route
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{k: data[k] for k in ("route", "check", "viewport", "throttle", "attempts") if k in data})
+
+
+@dataclass
+class CheckResult:
+    item: dict
+    status: str  # "passed", "failed" or "error"
+    duration: float
+    worker: str
+    details: dict = field(default_factory=dict)
+    error: str = ""
+
+
+def build_work_items(routes, checks, viewports=("desktop",), throttles=("none",)):
+    """Expand the cartesian product of the dimensions into work items."""
+    for name in viewports:
+        if name not in VIEWPORTS:
+            raise ValueError(f"Unknown viewport '{name}' (expected one of {sorted(VIEWPORTS)})")
+    for name in throttles:
+        if name not in THROTTLE_PROFILES:
+            raise ValueError(f"Unknown throttle profile '{name}' (expected one of {sorted(THROTTLE_PROFILES)})")
+    return [
+        WorkItem(route=route, check=check, viewport=viewport, throttle=throttle)
+        for route, check, viewport, throttle in itertools.product(routes, checks, viewports, throttles)
+    ]
+
+
+class DurationHistory:
+    """Per-item historical durations, smoothed with an exponential moving average."""
+
+    def __init__(self, path=None, alpha=0.5):
+        self.path = path
+        self.alpha = alpha
+        self.durations = {}
+        if path and os.path.exists(path):
+            with open(path, "r") as f:
+                self.durations = json.load(f)
+
+    def estimate(self, item):
+        """Best guess for an item: its own history, then its route's, then the overall mean."""
+        if item.key in self.durations:
+            return self.durations[item.key]
+        same_route = [d for k, d in self.durations.items() if k.split("|")[1] == item.route]
+        if same_route:
+            return sum(same_route) / len(same_route)
+        if self.durations:
+            return sum(self.durations.values()) / len(self.durations)
+        return DEFAULT_DURATION
+
+    def record(self, item, duration):
+        previous = self.durations.get(item.key)
+        if previous is None:
+            self.durations[item.key] = duration
+        else:
+            self.durations[item.key] = self.alpha * duration + (1 - self.alpha) * previous
+
+    def save(self):
+        if not self.path:
+            return
+        write_json_atomic(self.path, self.durations)
+
+
+def order_longest_first(items, history):
+    return sorted(items, key=lambda item: (-history.estimate(item), item.key))
+
+
+def select_shard(items, index, count):
+    """
+    Deterministic 1-based shard INDEX of COUNT: round-robin over the sorted item keys.
+
+    Depends only on the items themselves, never on a host's local duration history,
+    so every host that expands the same items splits them the same way.
+    """
+    if not 1 <= index <= count:
+        raise ValueError("shard index must satisfy 1 <= index <= count")
+    ordered = sorted(items, key=lambda item: item.key)
+    return ordered[index - 1::count]
+
+
+def write_json_atomic(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+class FileQueue:
+    """
+    Work queue backed by a directory, safe across processes and hosts on a shared mount.
+
+    pending/<rank>-<id>.json       waiting items; lexical order is longest-first
+    claimed/<worker>/<same name>   in-flight items; mtime is the worker's heartbeat
+    results/<id>.json              one CheckResult per finished item
+    """
+
+    def __init__(self, root, lease=DEFAULT_LEASE, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.root = root
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self.pending_dir = os.path.join(root, "pending")
+        self.claimed_dir = os.path.join(root, "claimed")
+        self.results_dir = os.path.join(root, "results")
+        for directory in (self.pending_dir, self.claimed_dir, self.results_dir):
+            os.makedirs(directory, exist_ok=True)
+
+    def enqueue(self, items, history):
+        ordered = order_longest_first(items, history)
+        for rank, item in enumerate(ordered):
+            self._put(f"{rank:06d}-{item.item_id}.json", item)
+        return ordered
+
+    def _put(self, name, item):
+        write_json_atomic(os.path.join(self.pending_dir, name), asdict(item))
+
+    def pending_count(self):
+        return len([n for n in os.listdir(self.pending_dir) if n.endswith(".json")])
+
+    def claimed_paths(self, worker_id=None):
+        workers = [worker_id] if worker_id else os.listdir(self.claimed_dir)
+        paths = []
+        for worker in workers:
+            directory = os.path.join(self.claimed_dir, worker)
+            if os.path.isdir(directory):
+                paths.extend(os.path.join(directory, n) for n in sorted(os.listdir(directory)) if n.endswith(".json"))
+        return paths
+
+    def is_drained(self):
+        return self.pending_count() == 0 and not self.claimed_paths()
+
+    def claim(self, worker_id):
+        """Atomically move the next pending item into this worker's claim directory."""
+        worker_dir = os.path.join(self.claimed_dir, worker_id)
+        os.makedirs(worker_dir, exist_ok=True)
+        for name in sorted(os.listdir(self.pending_dir)):
+            if not name.endswith(".json"):
+                continue
+            source = os.path.join(self.pending_dir, name)
+            target = os.path.join(worker_dir, name)
+            try:
+                # Refresh the mtime first: rename keeps it, and an enqueue-time mtime
+                # would let another process's requeue_expired treat the claim as stale.
+                os.utime(source)
+                os.rename(source, target)
+                os.utime(target)
+                with open(target, "r") as f:
+                    return target, WorkItem.from_dict(json.load(f))
+            except FileNotFoundError:
+                continue  # another worker won the race, or the claim was already re-queued
+        return None
+
+    def complete(self, claim_path, result):
+        write_json_atomic(os.path.join(self.results_dir, f"{WorkItem.from_dict(result.item).item_id}.json"), asdict(result))
+        try:
+            os.remove(claim_path)
+        except FileNotFoundError:
+            pass  # lease expired and the item was re-queued; the duplicate result is identical in shape
+
+    def heartbeat(self, claim_path):
+        try:
+            os.utime(claim_path)
+        except FileNotFoundError:
+            pass
+
+    def requeue(self, claim_path, reason):
+        """Return a claimed item to pending, or record an error once it has used up its attempts."""
+        try:
+            with open(claim_path, "r") as f:
+                item = WorkItem.from_dict(json.load(f))
+        except FileNotFoundError:
+            return
+        item.attempts += 1
+        if item.attempts >= self.max_attempts:
+            result = CheckResult(item=asdict(item), status="error", duration=0.0, worker="scheduler",
+                                 error=f"Gave up after {item.attempts} attempts: {reason}")
+            self.complete(claim_path, result)
+            return
+        self._put(os.path.basename(claim_path), item)
+        try:
+            os.remove(claim_path)
+        except FileNotFoundError:
+            pass
+        print(f"  ♻️  Re-queued {item.key} ({reason})")
+
+    def requeue_worker(self, worker_id, reason="worker exited"):
+        for path in self.claimed_paths(worker_id):
+            self.requeue(path, reason)
+
+    def requeue_expired(self):
+        """Re-queue claims whose heartbeat is older than the lease (crashed or partitioned hosts)."""
+        cutoff = time.time() - self.lease
+        for path in self.claimed_paths():
+            try:
+                expired = os.path.getmtime(path) < cutoff
+            except FileNotFoundError:
+                continue
+            if expired:
+                self.requeue(path, "lease expired")
+
+    def results(self):
+        return load_results(self.results_dir)
+
+
+def load_check(spec):
+    """Resolve a 'module:function' check reference."""
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Check '{spec}' must be given as 'module:function'")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def run_item(item, worker_id):
+    """Run one check; a check passes by returning (details or None) and fails by raising AssertionError."""
+    start = time.perf_counter()
+    try:
+        details = load_check(item.check)(item) or {}
+        json.dumps(details)  # unencodable details become an error here, not a crashed worker later
+        status, error = "passed", ""
+    except AssertionError as e:
+        details, status, error = {}, "failed", str(e)
+    except Exception:
+        details, status, error = {}, "error", traceback.format_exc()
+    return CheckResult(item=asdict(item), status=status, duration=time.perf_counter() - start,
+                       worker=worker_id, details=details, error=error)
+
+
+def worker_loop(queue_root, worker_id=None, lease=DEFAULT_LEASE, max_attempts=DEFAULT_MAX_ATTEMPTS, wait=False):
+    """Claim and run items until the queue is drained (or, with wait, until interrupted)."""
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    queue = FileQueue(queue_root, lease=lease, max_attempts=max_attempts)
+    completed = 0
+    while True:
+        claimed = queue.claim(worker_id)
+        if claimed is None:
+            queue.requeue_expired()
+            if queue.pending_count():
+                continue
+            if not wait and not queue.claimed_paths():
+                return completed
+            time.sleep(1.0)
+            continue
+
+        claim_path, item = claimed
+        stop = threading.Event()
+        beat = threading.Thread(target=_heartbeat, args=(queue, claim_path, stop), daemon=True)
+        beat.start()
+        try:
+            result = run_item(item, worker_id)
+        finally:
+            stop.set()
+            beat.join()
+        queue.complete(claim_path, result)
+        completed += 1
+        print(f"  [{worker_id}] {result.status.upper():6} {result.duration:6.2f}s  {item.key}")
+
+
+def _heartbeat(queue, claim_path, stop):
+    while not stop.wait(queue.lease / 3):
+        queue.heartbeat(claim_path)
+
+
+def _worker_process(queue_root, worker_id, lease, max_attempts):
+    worker_loop(queue_root, worker_id=worker_id, lease=lease, max_attempts=max_attempts)
+
+
+def run_local(queue_root, workers, lease=DEFAULT_LEASE, max_attempts=DEFAULT_MAX_ATTEMPTS, poll_interval=0.5):
+    """Drain the queue with local worker processes, re-queueing items held by any that crash."""
+    queue = FileQueue(queue_root, lease=lease, max_attempts=max_attempts)
+    context = multiprocessing.get_context("spawn")
+    processes = {}
+    spawned = itertools.count()
+
+    def spawn():
+        worker_id = f"{socket.gethostname()}-local-{next(spawned)}"
+        process = context.Process(target=_worker_process, args=(queue_root, worker_id, lease, max_attempts))
+        process.start()
+        processes[worker_id] = process
+
+    for _ in range(min(workers, max(queue.pending_count(), 1))):
+        spawn()
+
+    while processes:
+        time.sleep(poll_interval)
+        for worker_id, process in list(processes.items()):
+            if process.is_alive():
+                continue
+            del processes[worker_id]
+            if process.exitcode != 0:
+                print(f"  💥 Worker {worker_id} exited with code {process.exitcode}")
+            queue.requeue_worker(worker_id, reason=f"worker {worker_id} exited with code {process.exitcode}")
+        queue.requeue_expired()
+        while queue.pending_count() and len(processes) < workers:
+            spawn()
+
+
+def load_results(*results_dirs):
+    """Load results from one or more result directories, keeping the newest result per item."""
+    merged = {}
+    for directory in results_dirs:
+        if not os.path.isdir(directory):
+            continue
+        for name in os.listdir(directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(directory, name)
+            with open(path, "r") as f:
+                data = json.load(f)
+            mtime = os.path.getmtime(path)
+            if name not in merged or mtime >= merged[name][0]:
+                merged[name] = (mtime, data)
+    return [data for _, data in merged.values()]
+
+
+def merge_reports(results):
+    """Combine per-item results (from any number of hosts) into a single report."""
+    results = sorted(results, key=lambda r: WorkItem.from_dict(r["item"]).key)
+    summary = {"total": len(results), "passed": 0, "failed": 0, "error": 0}
+    workers = {}
+    for result in results:
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+        worker = workers.setdefault(result["worker"], {"items": 0, "busy_seconds": 0.0})
+        worker["items"] += 1
+        worker["busy_seconds"] += result["duration"]
+    return {
+        "generated_at": time.time(),
+        "summary": summary,
+        "workers": workers,
+        "slowest": [
+            {"key": WorkItem.from_dict(r["item"]).key, "duration": r["duration"]}
+            for r in sorted(results, key=lambda r: r["duration"], reverse=True)[:10]
+        ],
+        "results": results,
+    }
+
+
+def record_durations(history, results):
+    """Fold passed results into the history; failures often stop early and would look fast."""
+    for result in results:
+        if result["status"] == "passed" and result["duration"] > 0:
+            history.record(WorkItem.from_dict(result["item"]), result["duration"])
+    history.save()
+
+
+def page_load_check(item):
+    """Built-in check: load the route under the item's viewport and throttle profile."""
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            page = browser.new_context(viewport=VIEWPORTS[item.viewport]).new_page()
+            apply_throttle(page, item.throttle)
+            page_errors = []
+            page.on("pageerror", lambda error: page_errors.append(str(error)))
+            start = time.perf_counter()
+            response = page.goto(item.url, wait_until="networkidle", timeout=60000)
+            load_time = time.perf_counter() - start
+            assert response is None or response.ok, f"{item.url} returned HTTP {response.status}"
+            assert not page_errors, f"JavaScript errors on {item.route}: {page_errors}"
+            return {"loadTime": load_time * 1000}
+        finally:
+            browser.close()
+
+
+def apply_throttle(page, profile_name):
+    """Apply a THROTTLE_PROFILES entry to a Chromium page through the DevTools protocol."""
+    profile = THROTTLE_PROFILES[profile_name]
+    if profile is None:
+        return
+    cdp = page.context.new_cdp_session(page)
+    cdp.send("Network.enable")
+    cdp.send("Network.emulateNetworkConditions", {
+        "offline": False,
+        "latency": profile["latency"],
+        "downloadThroughput": profile["download"],
+        "uploadThroughput": profile["upload"],
+    })
+    cdp.send("Emulation.setCPUThrottlingRate", {"rate": profile["cpu"]})
+
+
+def parse_shard(value):
+    index, _, count = value.partition("/")
+    index, count = int(index), int(count)
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError("shard must be INDEX/COUNT with 1 <= INDEX <= COUNT")
+    return index, count
+
+
+def _add_item_arguments(parser):
+    parser.add_argument("--route", action="append", dest="routes", help="Route to check (repeatable; default: all app routes)")
+    parser.add_argument("--check", action="append", dest="checks", help="Check as module:function (repeatable)")
+    parser.add_argument("--viewport", action="append", dest="viewports", help=f"One of {sorted(VIEWPORTS)} (repeatable)")
+    parser.add_argument("--throttle", action="append", dest="throttles", help=f"One of {sorted(THROTTLE_PROFILES)} (repeatable)")
+    parser.add_argument("--shard", type=parse_shard,
+                        help="Only enqueue shard INDEX/COUNT (round-robin over sorted items, the same on every host)")
+    parser.add_argument("--history", default="ux-check-durations.json", help="Duration history file")
+
+
+def _enqueue_from_args(args, queue):
+    history = DurationHistory(args.history)
+    items = build_work_items(
+        args.routes or ROUTES,
+        args.checks or ["check_scheduler:page_load_check"],
+        args.viewports or ["desktop"],
+        args.throttles or ["none"],
+    )
+    if args.shard:
+        index, count = args.shard
+        items = select_shard(items, index, count)
+    ordered = queue.enqueue(items, history)
+    estimate = sum(history.estimate(item) for item in ordered)
+    print(f"📥 Enqueued {len(ordered)} items (~{estimate:.0f}s of work) into {queue.root}")
+
+
+def _write_report(results, output, history_path=None):
+    report = merge_reports(results)
+    write_json_atomic(output, report)
+    if history_path:
+        record_durations(DurationHistory(history_path), results)
+    summary = report["summary"]
+    print(f"📋 {summary['total']} results: {summary['passed']} passed, {summary['failed']} failed, "
+          f"{summary['error']} errors -> {output}")
+    return 0 if summary["failed"] == 0 and summary["error"] == 0 else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = subparsers.add_parser("enqueue", help="Expand work items into a queue directory")
+    enqueue.add_argument("--queue", required=True)
+    _add_item_arguments(enqueue)
+
+    worker = subparsers.add_parser("worker", help="Drain a (possibly shared) queue directory")
+    worker.add_argument("--queue", required=True)
+    worker.add_argument("--worker-id")
+    worker.add_argument("--lease", type=float, default=DEFAULT_LEASE)
+    worker.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+    worker.add_argument("--wait", action="store_true", help="Keep polling after the queue drains")
+
+    run = subparsers.add_parser("run", help="Enqueue and drain with local worker processes")
+    run.add_argument("--queue", help="Queue directory (default: a temporary directory)")
+    run.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    run.add_argument("--lease", type=float, default=DEFAULT_LEASE)
+    run.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+    run.add_argument("--output", default="ux-check-report.json")
+    _add_item_arguments(run)
+
+    merge = subparsers.add_parser("merge", help="Merge results from one or more queue directories")
+    merge.add_argument("queues", nargs="+")
+    merge.add_argument("--output", default="ux-check-report.json")
+    merge.add_argument("--history", help="Update this duration history with the merged timings")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "enqueue":
+        _enqueue_from_args(args, FileQueue(args.queue))
+        return 0
+    if args.command == "worker":
+        worker_loop(args.queue, worker_id=args.worker_id, lease=args.lease,
+                    max_attempts=args.max_attempts, wait=args.wait)
+        return 0
+    if args.command == "run":
+        queue_root = args.queue or tempfile.mkdtemp(prefix="ux-check-queue-")
+        queue = FileQueue(queue_root, lease=args.lease, max_attempts=args.max_attempts)
+        _enqueue_from_args(args, queue)
+        run_local(queue_root, args.workers, lease=args.lease, max_attempts=args.max_attempts)
+        return _write_report(queue.results(), args.output, args.history)
+    if args.command == "merge":
+        results = load_results(*(os.path.join(q, "results") for q in args.queues))
+        return _write_report(results, args.output, args.history)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
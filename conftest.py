@@ -0,0 +1 @@
+pytest_plugins = ["ux_pytest_plugin"]
@@ -0,0 +1,296 @@
+"""
+Scheduler checks that run without a browser: stand-in checks in this module
+and a queue in ``tmp_path``.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict
+
+import pytest
+
+import check_scheduler
+from check_scheduler import (
+    CheckResult,
+    DurationHistory,
+    FileQueue,
+    WorkItem,
+    build_work_items,
+    load_results,
+    main,
+    merge_reports,
+    order_longest_first,
+    record_durations,
+    run_item,
+    run_local,
+    select_shard,
+    worker_loop,
+    write_json_atomic,
+)
+
+CHECK = f"{__name__}:passing_check"
+
+
+def passing_check(item):
+    return {"route": item.route}
+
+
+def failing_check(item):
+    assert item.viewport != "mobile", "mobile broken"
+
+
+def erroring_check(item):
+    raise RuntimeError("boom")
+
+
+def unencodable_check(item):
+    return {"when": object()}
+
+
+def crash_once_check(item):
+    """Kills its worker process the first time; the route is a marker file path."""
+    if not os.path.exists(item.route):
+        open(item.route, "w").close()
+        os._exit(3)
+
+
+def make_result(route, status="passed", duration=1.0, worker="w1"):
+    return asdict(CheckResult(item=asdict(WorkItem(route=route, check=CHECK)), status=status,
+                              duration=duration, worker=worker))
+
+
+def test_build_work_items_expands_every_dimension():
+    items = build_work_items(["/", "/history"], [CHECK], ["mobile", "desktop"], ["none", "slow-3g"])
+
+    assert len(items) == 8
+    assert len({item.key for item in items}) == 8
+
+
+@pytest.mark.parametrize("kwargs", [{"viewports": ["watch"]}, {"throttles": ["dial-up"]}])
+def test_build_work_items_rejects_unknown_dimensions(kwargs):
+    with pytest.raises(ValueError):
+        build_work_items(["/"], [CHECK], **kwargs)
+
+
+def test_estimate_falls_back_to_route_then_overall_mean(tmp_path):
+    history = DurationHistory(str(tmp_path / "history.json"))
+    slow = WorkItem(route="/slow", check="a")
+    fast = WorkItem(route="/fast", check="a")
+
+    assert history.estimate(slow) == 5.0  # nothing recorded yet
+
+    history.record(slow, 9.0)
+    history.record(fast, 3.0)
+
+    assert history.estimate(WorkItem(route="/slow", check="b")) == 9.0
+    assert history.estimate(WorkItem(route="/other", check="b")) == 6.0  # mean of 9 and 3
+
+
+def test_history_smooths_and_round_trips(tmp_path):
+    path = str(tmp_path / "history.json")
+    history = DurationHistory(path)
+    item = WorkItem(route="/", check="a")
+    history.record(item, 4.0)
+    history.record(item, 2.0)
+    history.save()
+
+    assert DurationHistory(path).estimate(item) == 3.0
+
+
+def test_order_longest_first():
+    history = DurationHistory()
+    items = build_work_items(["/a", "/b", "/c"], [CHECK])
+    for item, duration in zip(items, [1.0, 3.0, 2.0]):
+        history.record(item, duration)
+
+    assert [item.route for item in order_longest_first(items, history)] == ["/b", "/c", "/a"]
+
+
+def test_select_shard_is_a_partition_independent_of_input_order():
+    items = build_work_items([f"/r{i}" for i in range(13)], [CHECK])
+    shards = [select_shard(items, index, 3) for index in (1, 2, 3)]
+    reversed_shards = [select_shard(list(reversed(items)), index, 3) for index in (1, 2, 3)]
+
+    keys = [item.key for shard in shards for item in shard]
+    assert sorted(keys) == sorted(item.key for item in items)
+    assert len(keys) == len(set(keys))
+    assert [[i.key for i in s] for s in shards] == [[i.key for i in s] for s in reversed_shards]
+    assert [len(shard) for shard in shards] == [5, 4, 4]
+
+
+def test_select_shard_rejects_out_of_range_index():
+    with pytest.raises(ValueError):
+        select_shard([], 3, 2)
+
+
+def test_queue_claims_longest_first_and_completes(tmp_path):
+    history = DurationHistory()
+    items = build_work_items(["/short", "/long"], [CHECK])
+    history.record(items[1], 10.0)
+    history.record(items[0], 1.0)
+    queue = FileQueue(str(tmp_path / "queue"))
+    queue.enqueue(items, history)
+
+    claim_path, item = queue.claim("w1")
+    assert item.route == "/long"
+    assert queue.pending_count() == 1
+
+    queue.complete(claim_path, run_item(item, "w1"))
+    assert not queue.claimed_paths()
+    assert [r["status"] for r in queue.results()] == ["passed"]
+
+
+def test_claim_returns_none_when_empty(tmp_path):
+    assert FileQueue(str(tmp_path / "queue")).claim("w1") is None
+
+
+def test_claim_survives_concurrent_expiry_sweep(tmp_path, monkeypatch):
+    queue = FileQueue(str(tmp_path / "queue"), lease=60)
+    queue.enqueue(build_work_items(["/"], [CHECK]), DurationHistory())
+    pending = os.path.join(queue.pending_dir, os.listdir(queue.pending_dir)[0])
+    stale = time.time() - 3600
+    os.utime(pending, (stale, stale))  # enqueued long before this worker got to it
+
+    real_rename = os.rename
+
+    def rename_then_sweep(source, target):
+        real_rename(source, target)
+        queue.requeue_expired()  # another process sweeping right after the rename
+
+    monkeypatch.setattr(os, "rename", rename_then_sweep)
+    claim_path, item = queue.claim("w1")
+
+    assert os.path.exists(claim_path)
+    assert item.attempts == 0
+
+
+def test_expired_lease_is_requeued_with_attempt_count(tmp_path):
+    queue = FileQueue(str(tmp_path / "queue"), lease=60)
+    queue.enqueue(build_work_items(["/"], [CHECK]), DurationHistory())
+    claim_path, _ = queue.claim("w1")
+    stale = time.time() - 120
+    os.utime(claim_path, (stale, stale))
+
+    queue.requeue_expired()
+
+    assert not queue.claimed_paths()
+    assert queue.claim("w2")[1].attempts == 1
+
+
+def test_requeue_records_error_after_max_attempts(tmp_path):
+    queue = FileQueue(str(tmp_path / "queue"), max_attempts=2)
+    queue.enqueue(build_work_items(["/"], [CHECK]), DurationHistory())
+
+    for worker_id in ("w1", "w2"):
+        queue.claim(worker_id)
+        queue.requeue_worker(worker_id)
+
+    assert queue.is_drained()
+    [result] = queue.results()
+    assert result["status"] == "error"
+    assert "Gave up after 2 attempts" in result["error"]
+
+
+def test_run_item_classifies_outcomes():
+    assert run_item(WorkItem(route="/", check=CHECK), "w1").details == {"route": "/"}
+    assert run_item(WorkItem(route="/", check=f"{__name__}:failing_check", viewport="mobile"), "w1").status == "failed"
+    errored = run_item(WorkItem(route="/", check=f"{__name__}:erroring_check"), "w1")
+    assert errored.status == "error"
+    assert "RuntimeError: boom" in errored.error
+
+
+def test_unencodable_details_are_an_error(tmp_path):
+    queue_root = str(tmp_path / "queue")
+    queue = FileQueue(queue_root)
+    queue.enqueue(build_work_items(["/"], [f"{__name__}:unencodable_check"]), DurationHistory())
+
+    assert worker_loop(queue_root, worker_id="w1") == 1
+
+    [result] = queue.results()
+    assert result["status"] == "error"
+    assert "TypeError" in result["error"]
+    assert queue.is_drained()
+
+
+def test_write_json_atomic_follows_umask(tmp_path):
+    path = tmp_path / "out.json"
+    write_json_atomic(str(path), {})
+
+    assert path.stat().st_mode & 0o777 == 0o666 & ~check_scheduler._UMASK  # not mkstemp's 0600
+
+
+def test_write_json_atomic_cleans_up_on_failure(tmp_path):
+    with pytest.raises(TypeError):
+        write_json_atomic(str(tmp_path / "out.json"), {"when": object()})
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_worker_loop_drains_queue(tmp_path):
+    queue_root = str(tmp_path / "queue")
+    items = build_work_items(["/a", "/b"], [CHECK, f"{__name__}:failing_check"], ["mobile"])
+    FileQueue(queue_root).enqueue(items, DurationHistory())
+
+    assert worker_loop(queue_root, worker_id="w1") == 4
+    assert FileQueue(queue_root).is_drained()
+
+
+def test_run_local_requeues_items_from_crashed_workers(tmp_path):
+    queue_root = str(tmp_path / "queue")
+    routes = [str(tmp_path / f"marker-{i}") for i in range(3)]
+    queue = FileQueue(queue_root)
+    queue.enqueue(build_work_items(routes, [f"{__name__}:crash_once_check"]), DurationHistory())
+
+    run_local(queue_root, workers=2, poll_interval=0.1)
+
+    results = queue.results()
+    assert queue.is_drained()
+    assert sorted(r["status"] for r in results) == ["passed"] * 3
+    assert all(r["item"]["attempts"] == 1 for r in results)
+
+
+def test_load_results_keeps_newest_per_item(tmp_path):
+    old_dir, new_dir = tmp_path / "host-a", tmp_path / "host-b"
+    old_dir.mkdir()
+    new_dir.mkdir()
+    (old_dir / "item.json").write_text(json.dumps(make_result("/", status="failed")))
+    (new_dir / "item.json").write_text(json.dumps(make_result("/", status="passed")))
+    os.utime(old_dir / "item.json", (1, 1))
+
+    [result] = load_results(str(new_dir), str(old_dir), str(tmp_path / "missing"))
+    assert result["status"] == "passed"
+
+
+def test_merge_reports_summarises_results():
+    report = merge_reports([
+        make_result("/a", duration=3.0, worker="w1"),
+        make_result("/b", status="failed", duration=1.0, worker="w2"),
+        make_result("/c", status="error", duration=0.0, worker="w2"),
+    ])
+
+    assert report["summary"] == {"total": 3, "passed": 1, "failed": 1, "error": 1}
+    assert report["workers"]["w2"]["items"] == 2
+    assert report["slowest"][0]["duration"] == 3.0
+
+
+def test_record_durations_only_counts_passed_results(tmp_path):
+    history = DurationHistory(str(tmp_path / "history.json"))
+    record_durations(history, [make_result("/a", duration=2.0), make_result("/b", status="failed", duration=0.1)])
+
+    assert list(history.durations) == [WorkItem(route="/a", check=CHECK).key]
+
+
+def test_cli_run_then_merge(tmp_path, capsys):
+    queue_root = str(tmp_path / "queue")
+    history = str(tmp_path / "history.json")
+    common = ["--check", CHECK, "--route", "/a", "--route", "/b", "--history", history]
+
+    assert main(["enqueue", "--queue", queue_root, "--shard", "1/2", *common]) == 0
+    assert FileQueue(queue_root).pending_count() == 1
+    assert main(["worker", "--queue", queue_root, "--worker-id", "w1"]) == 0
+    assert main(["merge", queue_root, "--output", str(tmp_path / "report.json"), "--history", history]) == 0
+
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["summary"]["passed"] == 1
+    assert len(json.loads(open(history).read())) == 1
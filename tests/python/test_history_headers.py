@@ -0,0 +1,55 @@
+"""
+History table header checks: every Blueprint native column header is rendered
+exactly once, inside a single <thead>.
+"""
+
+import pytest
+
+HISTORY_HEADERS = [
+    "Deck Name",
+    "Deck Status",
+    "Processing Status",
+    "Progress",
+    "Created",
+    "Completed",
+    "Actions",
+]
+
+pytestmark = pytest.mark.ux_routes("/history")
+
+
+def describe_matches(locator):
+    """Summarise where each match of a locator lives, for duplicate-header failures."""
+    descriptions = []
+    for element in locator.all():
+        tag_name = element.evaluate("el => el.tagName").lower()
+        parent_tag = element.evaluate("el => el.parentElement?.tagName") or "unknown"
+        descriptions.append(f"<{tag_name}> inside <{parent_tag.lower()}>")
+    return descriptions
+
+
+@pytest.mark.parametrize("header", HISTORY_HEADERS)
+def test_header_rendered_once(loaded_page, header):
+    matches = loaded_page.locator(f"text={header}")
+    count = matches.count()
+
+    assert count > 0, f"Missing header: {header}"
+    assert count == 1, f"Duplicate header '{header}': {describe_matches(matches)}"
+
+
+def test_single_table_header(loaded_page, artifact_path):
+    thead_count = loaded_page.locator("thead").count()
+    if thead_count != 1:
+        loaded_page.screenshot(path=artifact_path("history-table.png"), full_page=True)
+
+    assert thead_count != 0, "No <thead> element found"
+    assert thead_count == 1, f"Multiple table header structures found ({thead_count} <thead> elements)"
+
+
+def test_headers_inside_thead(loaded_page):
+    thead = loaded_page.locator("thead")
+    assert thead.count() > 0, "No <thead> element found"
+    thead_text = thead.first.text_content()
+
+    missing = [header for header in HISTORY_HEADERS if header not in thead_text]
+    assert not missing, f"Headers not inside <thead>: {missing}"
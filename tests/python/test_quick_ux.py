@@ -0,0 +1,170 @@
+"""
+Quick UX checks for the Collection Management app: load health,
+accessibility, interactions, navigation and responsive layout.
+"""
+
+import pytest
+
+from check_scheduler import VIEWPORTS
+
+ACCESSIBILITY_AUDIT = """
+    () => {
+        const images = document.querySelectorAll('img');
+        const inputs = document.querySelectorAll('input, textarea, select');
+        const headings = document.querySelectorAll('h1, h2, h3, h4, h5, h6');
+        const focusableElements = document.querySelectorAll('a[href], button, input, textarea, select, [tabindex]:not([tabindex="-1"])');
+
+        // Check alt text on images
+        let imagesWithAlt = 0;
+        images.forEach(img => {
+            const alt = img.getAttribute('alt');
+            if (alt && alt.trim().length > 0) imagesWithAlt++;
+        });
+
+        // Check form labels
+        let labeledInputs = 0;
+        inputs.forEach(input => {
+            const hasLabel = document.querySelector(`label[for="${input.id}"]`) ||
+                            input.closest('label') ||
+                            input.getAttribute('aria-label') ||
+                            input.getAttribute('aria-labelledby');
+            if (hasLabel) labeledInputs++;
+        });
+
+        // Check heading hierarchy
+        let headingIssues = 0;
+        let lastLevel = 0;
+        headings.forEach(heading => {
+            const level = parseInt(heading.tagName.charAt(1));
+            if (level > lastLevel + 1) headingIssues++;
+            lastLevel = level;
+        });
+
+        return {
+            images: { total: images.length, withAlt: imagesWithAlt },
+            forms: { total: inputs.length, labeled: labeledInputs },
+            headings: { total: headings.length, hierarchyIssues: headingIssues },
+            navigation: {
+                focusableElements: focusableElements.length,
+                landmarks: document.querySelectorAll('[role="main"], [role="navigation"], [role="banner"], [role="contentinfo"], main, nav, header, footer').length
+            }
+        };
+    }
+"""
+
+PERFORMANCE_METRICS = """
+    () => {
+        const navigation = performance.getEntriesByType('navigation')[0];
+        const paint = performance.getEntriesByType('paint');
+
+        return {
+            loadTime: navigation ? navigation.loadEventEnd : 0,
+            domReady: navigation ? navigation.domContentLoadedEventEnd : 0,
+            firstContentfulPaint: paint.find(p => p.name === 'first-contentful-paint')?.startTime || 0,
+            resourceCount: performance.getEntriesByType('resource').length
+        };
+    }
+"""
+
+# Loads at or above this were reported as "Slow page load performance".
+LOAD_TIME_BUDGET_MS = 4000
+
+
+def accessibility_score(audit):
+    """Score out of 100: alt text 20, form labels 30, landmarks 20, heading hierarchy 20, focusable 10."""
+    score = 0
+    if audit['images']['total'] > 0:
+        score += audit['images']['withAlt'] / audit['images']['total'] * 20
+    else:
+        score += 20
+    if audit['forms']['total'] > 0:
+        score += audit['forms']['labeled'] / audit['forms']['total'] * 30
+    else:
+        score += 30
+    score += min(audit['navigation']['landmarks'] * 5, 20)
+    if audit['headings']['total'] > 0:
+        score += max(0, 20 - audit['headings']['hierarchyIssues'] * 5)
+    if audit['navigation']['focusableElements'] > 0:
+        score += 10
+    return round(score)
+
+
+def test_page_loads_without_errors(loaded_page, page_errors, throttle, record_property):
+    metrics = loaded_page.evaluate(PERFORMANCE_METRICS)
+    for name, value in metrics.items():
+        record_property(name, value)
+
+    assert not page_errors, f"{len(page_errors)} JavaScript errors detected: {page_errors}"
+    if throttle == "none":  # the budget is for unthrottled loads; throttled runs only record metrics
+        assert metrics['loadTime'] < LOAD_TIME_BUDGET_MS, f"Slow page load performance: {metrics['loadTime']:.0f}ms"
+
+
+def test_accessibility_score(loaded_page, record_property):
+    audit = loaded_page.evaluate(ACCESSIBILITY_AUDIT)
+    score = accessibility_score(audit)
+    record_property("accessibilityScore", score)
+
+    assert score >= 80, f"Accessibility compliance below 80% ({score}%): {audit}"
+
+
+@pytest.mark.ux_viewports(*VIEWPORTS)
+def test_no_horizontal_scroll(loaded_page, viewport, artifact_path):
+    layout = loaded_page.evaluate("""
+        () => ({
+            viewportWidth: window.innerWidth,
+            contentWidth: document.body.scrollWidth
+        })
+    """)
+    if layout['contentWidth'] > layout['viewportWidth']:
+        loaded_page.screenshot(path=artifact_path(f"responsive-{viewport}.png"))
+
+    assert layout['contentWidth'] <= layout['viewportWidth'], f"Horizontal scroll on {viewport}: {layout}"
+
+
+@pytest.mark.ux_routes("/")
+def test_buttons_respond_to_clicks(loaded_page, page_errors):
+    buttons = loaded_page.locator('button:visible')
+    clicked = 0
+    for i in range(min(buttons.count(), 4)):  # Test first 4 buttons
+        button = buttons.nth(i)
+        if not button.is_enabled():
+            continue
+        button.click()
+        loaded_page.wait_for_timeout(750)
+        clicked += 1
+
+    assert not page_errors, f"JavaScript errors after clicking {clicked} buttons: {page_errors}"
+
+
+@pytest.mark.ux_routes("/")
+def test_text_inputs_accept_input(loaded_page):
+    inputs = loaded_page.locator('input:visible, textarea:visible')
+    for i in range(min(inputs.count(), 3)):  # Test first 3 inputs
+        input_elem = inputs.nth(i)
+        if input_elem.get_attribute('type') not in ['text', 'search', 'email', 'number', None]:
+            continue
+        value = '42' if input_elem.get_attribute('type') == 'number' else 'test value'
+        input_elem.fill(value)
+
+        assert input_elem.input_value() == value, f"Input {i + 1} did not keep its value"
+
+
+@pytest.mark.ux_routes("/")
+def test_navigation_links_change_page(loaded_page):
+    links = loaded_page.locator('nav a, [role="navigation"] a')
+    stuck = []
+    for i in range(min(links.count(), 3)):  # Test first 3 nav links
+        link = links.nth(i)
+        href = link.get_attribute('href')
+        if not href or href.startswith('http') or href.startswith('mailto:'):
+            continue
+        current_url = loaded_page.url
+        link.click()
+        loaded_page.wait_for_timeout(1000)
+        if loaded_page.url == current_url:
+            stuck.append(href)
+        else:
+            loaded_page.go_back()
+            loaded_page.wait_for_timeout(500)
+
+    assert not stuck, f"Navigation stayed on the same page for: {stuck}"
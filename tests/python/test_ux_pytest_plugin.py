@@ -0,0 +1,207 @@
+"""
+ux_pytest_plugin checks that run without a browser, through ``pytester``.
+"""
+
+import json
+import os
+
+import pytest
+
+import check_scheduler
+from check_scheduler import ROUTES, WorkItem
+
+# Only this module needs pytester; a non-root conftest can't enable plugins.
+pytest_plugins = ["pytester"]
+
+ROUTE_TESTS = """
+    import pytest
+
+    def test_default(route, ux_browser):
+        pass
+
+    @pytest.mark.ux_routes("/a", "/b", "/c")
+    @pytest.mark.ux_viewports("mobile", "desktop")
+    def test_marked(route, viewport, ux_browser):
+        pass
+"""
+
+# Stands in for Chromium; requesting ux_browser is what makes a test a UX check.
+STUB_BROWSER = """
+    import pytest
+
+    @pytest.fixture(scope="session")
+    def ux_browser():
+        return None
+"""
+
+
+@pytest.fixture(autouse=True)
+def inner_project(pytester, monkeypatch):
+    """Keep installed plugins such as pytest-playwright out of the inner runs, and stub the browser."""
+    monkeypatch.setenv("PYTEST_DISABLE_PLUGIN_AUTOLOAD", "1")
+    pytester.makeconftest(STUB_BROWSER)
+
+
+def run(pytester, *args):
+    return pytester.runpytest("-p", "ux_pytest_plugin", *args)
+
+
+def collected(result):
+    return [line for line in result.outlines if "::" in line]
+
+
+def run_collect(pytester, *args):
+    return collected(run(pytester, "--collect-only", "-q", *args))
+
+
+def write_history(pytester, name, durations):
+    """Write a history file from {nodeid: duration} for tests that only take ``route``."""
+    history = {}
+    for nodeid, duration in durations.items():
+        route = nodeid.split("[", 1)[1].rstrip("]")
+        history[WorkItem(route=route, check=f"pytest:{nodeid}").key] = duration
+    path = pytester.path / name
+    path.write_text(json.dumps(history))
+    return str(path)
+
+
+def test_markers_and_options_parametrize(pytester):
+    pytester.makepyfile(test_routes=ROUTE_TESTS)
+
+    items = run_collect(pytester)
+    assert len([i for i in items if "test_default" in i]) == len(ROUTES)
+    assert len([i for i in items if "test_marked" in i]) == 6
+
+    items = run_collect(pytester, "--ux-route", "/only")
+    assert [i for i in items if "test_default" in i] == ["test_routes.py::test_default[/only]"]
+
+    result = run(pytester, "--ux-route", "/only", "-k", "test_marked")
+    result.assert_outcomes(skipped=2, deselected=1)  # no overlap with the marker's routes
+
+    items = run_collect(pytester, "--ux-route", "/b", "--ux-viewport", "mobile")
+    assert [i for i in items if "test_marked" in i] == ["test_routes.py::test_marked[/b-mobile]"]
+
+
+def test_collection_is_ordered_longest_first(pytester):
+    pytester.makepyfile(test_routes=ROUTE_TESTS)
+    history = write_history(pytester, "history.json", {
+        "test_routes.py::test_default[/]": 1.0,
+        "test_routes.py::test_default[/analytics]": 9.0,
+        "test_routes.py::test_default[/history]": 4.0,
+    })
+
+    items = run_collect(pytester, "--ux-history", history, "--ux-route=/", "--ux-route=/history",
+                        "--ux-route=/analytics", "-k", "test_default")
+
+    assert items == [
+        "test_routes.py::test_default[/analytics]",
+        "test_routes.py::test_default[/history]",
+        "test_routes.py::test_default[/]",
+    ]
+
+
+def test_shards_partition_tests_whatever_the_history(pytester):
+    pytester.makepyfile(test_routes=ROUTE_TESTS)
+    fresh = str(pytester.path / "fresh.json")
+    skewed = write_history(pytester, "skewed.json", {"test_routes.py::test_default[/sccs]": 60.0})
+
+    everything = run_collect(pytester)
+    first = run_collect(pytester, "--ux-shard", "1/2", "--ux-history", skewed)
+    second = run_collect(pytester, "--ux-shard", "2/2", "--ux-history", fresh)
+
+    assert first and second
+    assert not set(first) & set(second)
+    assert sorted(first + second) == sorted(everything)
+
+
+def test_shard_reports_deselected(pytester):
+    pytester.makepyfile(test_routes=ROUTE_TESTS)
+
+    result = run(pytester, "--ux-shard", "1/2")
+
+    result.assert_outcomes(passed=8, deselected=8)
+
+
+def test_timings_report_and_history(pytester):
+    pytester.makepyfile(test_outcomes="""
+        import time
+        import pytest
+
+        @pytest.fixture
+        def slow_setup():
+            time.sleep(0.3)
+
+        @pytest.fixture
+        def broken():
+            raise RuntimeError("setup failed")
+
+        @pytest.mark.ux_routes("/slow")
+        def test_passes(route, ux_browser, slow_setup):
+            pass
+
+        @pytest.mark.ux_routes("/fails")
+        def test_fails(route, ux_browser):
+            assert False
+
+        @pytest.mark.ux_routes("/errors")
+        def test_errors(route, ux_browser, broken):
+            pass
+
+        @pytest.mark.ux_routes("/skips")
+        def test_skips(route, ux_browser):
+            pytest.skip("not today")
+    """)
+
+    result = run(pytester, "--ux-report", "report.json", "--ux-history", "history.json")
+
+    result.assert_outcomes(passed=1, failed=1, errors=1, skipped=1)
+    result.stdout.fnmatch_lines(["*slowest 3 UX checks*"])
+
+    report = json.loads((pytester.path / "report.json").read_text())
+    assert report["summary"] == {"total": 3, "passed": 1, "failed": 1, "error": 1}
+    statuses = {r["details"]["nodeid"]: r["status"] for r in report["results"]}
+    assert statuses == {
+        "test_outcomes.py::test_passes[/slow]": "passed",
+        "test_outcomes.py::test_fails[/fails]": "failed",
+        "test_outcomes.py::test_errors[/errors]": "error",
+    }
+    passed = next(r for r in report["results"] if r["status"] == "passed")
+    assert passed["duration"] < 0.3  # the slow setup is not counted
+
+    history = json.loads((pytester.path / "history.json").read_text())
+    assert list(history) == [WorkItem(route="/slow", check="pytest:test_outcomes.py::test_passes[/slow]").key]
+
+
+def test_other_tests_are_left_alone(pytester):
+    pytester.makepyfile(test_units="""
+        def test_b():
+            pass
+
+        def test_a():
+            pass
+    """)
+    pytester.makepyfile(test_routes=ROUTE_TESTS)
+
+    items = run_collect(pytester, "--ux-shard", "2/2")
+    assert [i for i in items if "test_units" in i] == ["test_units.py::test_b", "test_units.py::test_a"]
+    assert len(items) == 2 + 8  # unit tests are never sharded away
+
+    result = run(pytester, "-k", "test_units", "--junitxml", "junit.xml")
+    result.assert_outcomes(passed=2, deselected=16)
+    assert "UX checks" not in result.stdout.str()
+    assert not (pytester.path / "ux-check-durations.json").exists()
+    assert "ux_work_item" not in (pytester.path / "junit.xml").read_text()
+
+
+def test_parallel_workers_report_to_controller(pytester, monkeypatch):
+    pytest.importorskip("xdist")
+    monkeypatch.setenv("PYTHONPATH", os.path.dirname(os.path.abspath(check_scheduler.__file__)))
+    pytester.makepyfile(test_routes=ROUTE_TESTS)
+
+    result = pytester.runpytest_subprocess("-p", "xdist.plugin", "-p", "ux_pytest_plugin", "-n", "2",
+                                           "--ux-report", "report.json")
+
+    result.assert_outcomes(passed=16)
+    report = json.loads((pytester.path / "report.json").read_text())
+    assert report["summary"]["passed"] == 16
+    assert set(report["workers"]) == {"gw0", "gw1"}
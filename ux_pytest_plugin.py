@@ -0,0 +1,279 @@
+"""
+pytest plugin for the browser UX checks.
+
+Provides one browser per worker (``ux_browser``, session-scoped, so launched
+once per xdist worker) and a fresh context and page for every test
+(``ux_context``, ``ux_page``, or ``loaded_page`` already on its route), so app
+state never carries over between tests. Tests that request the ``route``,
+``viewport`` or ``throttle`` fixtures are parametrized over the app routes,
+viewports and throttle profiles from check_scheduler.
+
+Runs under pytest-xdist (``-n auto``): collection is ordered longest-first from
+the same duration history check_scheduler uses, so ``--dist load`` hands the
+slow pages out first, and ``--ux-shard I/N`` keeps a deterministic round-robin
+share of the collected tests for splitting a run across machines. Per-test
+timings feed a slowest tests summary, an optional JSON report and the duration
+history.
+"""
+
+from dataclasses import asdict
+
+import pytest
+
+from check_scheduler import (
+    BASE_URL,
+    ROUTES,
+    THROTTLE_PROFILES,
+    VIEWPORTS,
+    DurationHistory,
+    WorkItem,
+    apply_throttle,
+    merge_reports,
+    order_longest_first,
+    parse_shard,
+    record_durations,
+    select_shard,
+    write_json_atomic,
+)
+
+
+# Options and fixtures carry a ux prefix so this plugin can be installed next to
+# pytest-playwright and pytest-base-url, which own --base-url, --headed, browser and page.
+def pytest_addoption(parser):
+    group = parser.getgroup("ux", "browser UX checks")
+    group.addoption("--ux-base-url", default=BASE_URL, help="App under test (default: %(default)s)")
+    group.addoption("--ux-headed", action="store_true", help="Show the browser window")
+    group.addoption("--ux-route", action="append", dest="ux_routes", help="Route to check (repeatable; default: all app routes)")
+    group.addoption("--ux-viewport", action="append", dest="ux_viewports", help=f"One of {sorted(VIEWPORTS)} (repeatable)")
+    group.addoption("--ux-throttle", action="append", dest="ux_throttles", help=f"One of {sorted(THROTTLE_PROFILES)} (repeatable)")
+    group.addoption("--ux-shard", type=parse_shard, help="Only run shard INDEX/COUNT (round-robin over sorted node IDs)")
+    group.addoption("--ux-history", default="ux-check-durations.json", help="Duration history file (default: %(default)s)")
+    group.addoption("--ux-report", help="Write per-test timings and outcomes to this JSON report")
+    group.addoption("--ux-slowest", type=int, default=10, help="Number of slowest tests to list (default: %(default)s)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "ux_routes(*routes): check only these routes (narrowed further by --ux-route)")
+    config.addinivalue_line("markers", "ux_viewports(*viewports): check these viewports (narrowed further by --ux-viewport)")
+    config.addinivalue_line("markers", "ux_throttles(*profiles): check these throttle profiles (narrowed further by --ux-throttle)")
+    config._ux_history = DurationHistory(config.getoption("ux_history"))
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(UxTimings(config), "ux-timings")
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize route/viewport/throttle from the command line, else the defaults.
+
+    A marker narrows a test to its own values; with an option also given, the test
+    runs the intersection (an empty one is reported as a skip).
+    """
+    config = metafunc.config
+    dimensions = (
+        ("route", "ux_routes", config.getoption("ux_routes"), ROUTES),
+        ("viewport", "ux_viewports", config.getoption("ux_viewports"), ["desktop"]),
+        ("throttle", "ux_throttles", config.getoption("ux_throttles"), ["none"]),
+    )
+    for name, marker_name, chosen, default in dimensions:
+        if name not in metafunc.fixturenames:
+            continue
+        marker = metafunc.definition.get_closest_marker(marker_name)
+        if marker and chosen:
+            values = [value for value in marker.args if value in chosen]
+        elif marker:
+            values = list(marker.args)
+        else:
+            values = list(chosen or default)
+        metafunc.parametrize(name, values)
+
+
+def work_item_for(item):
+    """Describe a collected test as a scheduler WorkItem so it shares the duration history."""
+    params = getattr(getattr(item, "callspec", None), "params", {})
+    return WorkItem(
+        route=params.get("route", ""),
+        check=f"pytest:{item.nodeid}",
+        viewport=params.get("viewport", "desktop"),
+        throttle=params.get("throttle", "none"),
+    )
+
+
+def is_ux_item(item):
+    """Browser UX checks are the tests that use the plugin's browser; other suites are left alone."""
+    return "ux_browser" in getattr(item, "fixturenames", ())
+
+
+def pytest_collection_modifyitems(config, items):
+    ux_items = [item for item in items if is_ux_item(item)]
+    if not ux_items:
+        return
+    history = config._ux_history
+    by_key = {work_item_for(item).key: item for item in ux_items}
+    work_items = [work_item_for(item) for item in ux_items]
+
+    shard = config.getoption("ux_shard")
+    if shard:
+        index, count = shard
+        # Chosen from the collected node IDs alone, so machines with different
+        # histories still split the run into the same disjoint shards.
+        selected = select_shard(work_items, index, count)
+        selected_keys = {w.key for w in selected}
+        deselected = [by_key[w.key] for w in work_items if w.key not in selected_keys]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            deselected_ids = {id(item) for item in deselected}
+            items[:] = [item for item in items if id(item) not in deselected_ids]
+        work_items = selected
+
+    # Within the shard, deterministic for a given history file, so every xdist
+    # worker collects the same order. Other tests keep their positions.
+    longest_first = iter([by_key[w.key] for w in order_longest_first(work_items, history)])
+    items[:] = [next(longest_first) if is_ux_item(item) else item for item in items]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Attach the work item to UX check reports so the xdist controller, which only
+    # sees serialized reports, can key timings the same way the scheduler does.
+    outcome = yield
+    report = outcome.get_result()
+    if is_ux_item(item) and not any(name == "ux_work_item" for name, _ in report.user_properties):
+        report.user_properties.append(("ux_work_item", asdict(work_item_for(item))))
+
+
+class UxTimings:
+    """Collects per-test timings on the controlling process (never on xdist workers)."""
+
+    def __init__(self, config):
+        self.config = config
+        self.entries = {}
+
+    def pytest_runtest_logreport(self, report):
+        work_item = dict(report.user_properties).get("ux_work_item")
+        if work_item is None:
+            return  # not a UX check
+        entry = self.entries.setdefault(report.nodeid, {"duration": 0.0, "status": None, "worker": "main"})
+        if report.when == "call":
+            # Setup is left out: for a worker's first test it includes launching
+            # Chromium, which would pin that test to the front of the history.
+            entry["duration"] = report.duration
+        entry["work_item"] = work_item
+        node = getattr(report, "node", None)
+        if node is not None:
+            entry["worker"] = node.gateway.id
+        if report.skipped:
+            entry["status"] = "skipped"
+        elif report.failed:
+            entry["status"] = "failed" if report.when == "call" else "error"
+        elif report.when == "call":
+            entry["status"] = "passed"
+
+    def results(self):
+        """Finished tests in the result format check_scheduler.merge_reports expects."""
+        return [
+            {
+                "item": entry["work_item"],
+                "status": entry["status"],
+                "duration": entry["duration"],
+                "worker": entry["worker"],
+                "details": {"nodeid": nodeid},
+                "error": "",
+            }
+            for nodeid, entry in self.entries.items()
+            if entry["status"] in ("passed", "failed", "error")
+        ]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        count = self.config.getoption("ux_slowest")
+        slowest = sorted(self.results(), key=lambda r: r["duration"], reverse=True)[:count]
+        if not slowest:
+            return
+        terminalreporter.write_sep("=", f"slowest {len(slowest)} UX checks")
+        for result in slowest:
+            terminalreporter.write_line(f"{result['duration']:8.2f}s  {result['details']['nodeid']}  [{result['worker']}]")
+
+    def pytest_sessionfinish(self, session):
+        results = self.results()
+        if not results:
+            return
+        record_durations(self.config._ux_history, results)
+        report_path = self.config.getoption("ux_report")
+        if report_path:
+            write_json_atomic(report_path, merge_reports(results))
+
+
+@pytest.fixture(scope="session")
+def ux_base_url(pytestconfig):
+    """Base URL of the running app; tests are skipped when nothing is listening there."""
+    from urllib.error import URLError
+    from urllib.request import urlopen
+
+    url = pytestconfig.getoption("ux_base_url").rstrip("/")
+    try:
+        urlopen(url, timeout=5).close()
+    except (URLError, OSError) as e:
+        pytest.skip(f"App not reachable at {url} ({e}); start it with `npm start`")
+    return url
+
+
+@pytest.fixture(scope="session")
+def ux_browser(pytestconfig):
+    """One Chromium instance per pytest process (i.e. per xdist worker)."""
+    sync_api = pytest.importorskip("playwright.sync_api")
+    with sync_api.sync_playwright() as p:
+        browser = p.chromium.launch(headless=not pytestconfig.getoption("ux_headed"))
+        yield browser
+        browser.close()
+
+
+@pytest.fixture
+def viewport():
+    """Overridden by parametrization; tests that don't ask for a viewport run on desktop."""
+    return "desktop"
+
+
+@pytest.fixture
+def throttle():
+    return "none"
+
+
+@pytest.fixture
+def ux_context(ux_browser, viewport):
+    """A fresh context per test, so cookies and storage never leak between tests."""
+    context = ux_browser.new_context(viewport=VIEWPORTS[viewport])
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def page_errors():
+    """Uncaught JavaScript errors raised by ``ux_page`` during the test."""
+    return []
+
+
+@pytest.fixture
+def ux_page(ux_context, throttle, page_errors):
+    page = ux_context.new_page()
+    apply_throttle(page, throttle)
+    page.on("pageerror", lambda error: page_errors.append(str(error)))
+    yield page
+    page.close()
+
+
+@pytest.fixture
+def loaded_page(ux_base_url, ux_page, route):
+    """``ux_page`` navigated to the parametrized route and settled."""
+    # ux_base_url comes first so an unreachable app skips before a browser is launched.
+    ux_page.goto(ux_base_url + route, wait_until="networkidle", timeout=60000)
+    return ux_page
+
+
+@pytest.fixture
+def artifact_path(request, tmp_path_factory):
+    """Return a path for screenshots and other artifacts, unique to this test."""
+    directory = tmp_path_factory.mktemp("ux-artifacts", numbered=True)
+
+    def make(name):
+        return str(directory / f"{request.node.name}-{name}".replace("/", "_"))
+
+    return make